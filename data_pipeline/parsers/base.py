@@ -0,0 +1,433 @@
+import csv
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+
+STANDARD_COLUMNS = [
+    "date",
+    "year",
+    "month",
+    "month_name",
+    "day",
+    "weekday",
+    "description",
+    "txn_type",
+    "amount",
+    "balance",
+    "raw_text",
+    "category_l1",
+    "category_l2",
+    "category_l3",
+    "category_l4",
+    "source_bank",
+]
+
+FileType = Literal["xls", "xlsx", "csv"]
+SignConvention = Literal["split", "signed", "dr_cr"]
+
+EXCEL_ENGINES = {"xls": "xlrd", "xlsx": "openpyxl"}
+EXCEL_SIGNATURES = (b"\xd0\xcf\x11\xe0", b"PK\x03\x04")
+HEADER_SCAN_ROWS = 60
+NATIVE_DATE_TYPES = (datetime, pd.Timestamp, date, np.datetime64)
+
+
+@dataclass(frozen=True)
+class BankFormat:
+    """Declarative description of a bank statement layout.
+
+    `columns` maps a logical field (date, narration, debit, credit, amount,
+    indicator, balance) to keywords in priority order; each keyword is tried
+    in turn and the first header cell containing it is used. The header row is
+    detected as the first row matching every field in `header_fields`, unless
+    `header_row` pins it explicitly.
+
+    Sign conventions:
+    - split: separate debit and credit columns
+    - signed: one amount column, credits positive
+    - dr_cr: one amount column plus an indicator column starting with "cr"/"dr"
+    """
+
+    name: str
+    date_format: str
+    columns: Mapping[str, tuple[str, ...]] = field(hash=False)
+    sign_convention: SignConvention = "split"
+    file_types: tuple[FileType, ...] = ("xls",)
+    header_row: int | None = None
+    header_fields: tuple[str, ...] = ("date", "narration")
+    encoding: str = "utf-8-sig"
+
+    def __post_init__(self):
+        object.__setattr__(self, "columns", MappingProxyType(dict(self.columns)))
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    """Categories assigned when any keyword (and every `all_of`) is in the narration."""
+
+    applies_to: Literal["credit", "debit"]
+    keywords: tuple[str, ...]
+    categories: tuple[str, str, str, str]
+    all_of: tuple[str, ...] = ()
+
+
+DEFAULT_CREDIT_CATEGORIES = ("Income", "Transfer", "Others", "Miscellaneous")
+DEFAULT_DEBIT_CATEGORIES = ("Expense", "Miscellaneous", "Others", "Other")
+
+# Order matters: the first matching rule wins.
+CATEGORY_RULES = [
+    CategoryRule("credit", ("medicare",), ("Income", "Refund", "Medical", "QRG")),
+    CategoryRule("credit", ("barclays",), ("Income", "ESOP", "Buyback", "Buyback")),
+    CategoryRule("credit", ("zerodha broking",), ("Transfer", "Equity", "Zerodha", "Zerodha")),
+    CategoryRule("credit", ("salary",), ("Income", "Salary", "Monthly Salary", "Employer")),
+    CategoryRule("credit", ("flipkart",), ("Income", "Salary", "Monthly Salary", "Flipkart")),
+    CategoryRule("credit", ("interest",), ("Income", "Interest", "Bank Interest", "Savings Interest")),
+    CategoryRule("credit", ("rajasthan marud",), ("Transfer", "Home", "Home", "Home")),
+    CategoryRule("credit", ("ratan",), ("Transfer", "Home", "Father", "Home")),
+    CategoryRule("credit", ("rupinder",), ("Transfer", "Home", "Mother", "Home")),
+    CategoryRule("credit", ("priya",), ("Transfer", "Priya", "Priya", "Priya")),
+    CategoryRule("credit", ("the new india assu",), ("Income", "Refund", "Medical", "Insurance")),
+    CategoryRule("credit", ("avinder",), ("Transfer", "Self", "SBI", "SBI"), all_of=("state",)),
+    CategoryRule("credit", ("avinder",), ("Transfer", "Self", "Others", "Others")),
+    CategoryRule("debit", ("dainikbhaskar4",), ("Expense", "Miscellaneous", "News Paper", "DB")),
+    CategoryRule("debit", ("zerodhabroking",), ("Investment", "Equity", "Zerodha", "Zerodha")),
+    CategoryRule("debit", ("zerodhamf",), ("Investment", "Mutual Fund", "SIP", "Mutual Fund")),
+    CategoryRule("debit", ("appleservices",), ("Expense", "Miscellaneous", "Subscription", "Apple")),
+    CategoryRule("debit", ("altbalaji.razor",), ("Expense", "Miscellaneous", "Subscription", "Alt Balaji")),
+    CategoryRule("debit", ("blinkit",), ("Expense", "Grocery", "blinkit", "blinkit")),
+    CategoryRule("debit", ("zomato",), ("Expense", "Food", "zomato", "zomato")),
+    CategoryRule("debit", ("swiggy",), ("Expense", "Food", "swiggy", "swiggy")),
+    CategoryRule("debit", ("pizza",), ("Expense", "Food", "Others", "pizza")),
+    CategoryRule("debit", ("rajasthan marud",), ("Transfer", "Home", "Home", "Home")),
+    CategoryRule("debit", ("ratan",), ("Transfer", "Home", "Father", "Home")),
+    CategoryRule("debit", ("rupinder",), ("Transfer", "Home", "Mother", "Home")),
+    CategoryRule("debit", ("priya",), ("Transfer", "Priya", "Priya", "Priya")),
+    CategoryRule("debit", ("bbpsbp",), ("Expense", "Utility", "Electricity", "Electricity")),
+    CategoryRule("debit", ("airtelpostpaidb",), ("Expense", "Utility", "Internet", "Airtel")),
+    CategoryRule("debit", ("akshayakalpafar",), ("Expense", "Grocery", "Milk", "Akshayakalpa")),
+    CategoryRule("debit", ("neft", "imps", "rtgs"), ("Transfer", "Internal", "Bank Transfer", "NEFT/IMPS")),
+    CategoryRule("debit", ("card payment",), ("Transfer", "Credit Card", "Card Payment", "Credit Card Bill")),
+    CategoryRule("debit", ("cred",), ("Transfer", "Credit Card", "Card Payment", "Credit Card Bill")),
+    CategoryRule("debit", ("ppf",), ("Investment", "Debt", "PPF", "PPF Contribution")),
+    CategoryRule("debit", ("sip", "mutual"), ("Investment", "Mutual Fund", "SIP", "Mutual Fund")),
+    CategoryRule("debit", ("qrg",), ("Expense", "Medical", "Hospital", "QRG")),
+    CategoryRule("debit", ("trf to fd",), ("Investment", "Debt", "FD", "FD")),
+    CategoryRule("debit", ("cc billpay/self",), ("Transfer", "Credit Card", "Card Payment", "Credit Card Bill")),
+    CategoryRule("debit", ("groww",), ("Investment", "Equity", "Groww", "Groww")),
+    CategoryRule("debit", ("cloudnine",), ("Expense", "Medical", "Hospital", "Cloudnine")),
+    CategoryRule("debit", ("8750043112@ptye",), ("Expense", "Rent", "Rent", "Rent")),
+    CategoryRule("debit", ("personal loan",), ("Expense", "Loan", "Loan EMI", "Loan EMI")),
+    CategoryRule("debit", ("gst", "charge"), ("Expense", "Financial", "Bank Charges", "Charges")),
+    CategoryRule("debit", ("atm",), ("Expense", "Operational", "Cash Withdrawal", "ATM")),
+]
+
+
+def clean_text(text: str) -> str:
+    """Basic narration cleaning for a single value; use `clean_text_series` for columns"""
+    if pd.isna(text):
+        return ""
+
+    text = str(text)
+
+    text = re.sub(r"\s+", " ", text)
+    text = text.replace("/", " ")
+    text = text.replace("-", " ")
+
+    return text.strip()
+
+
+def clean_text_series(texts: pd.Series) -> pd.Series:
+    """Vectorized `clean_text` over a whole narration column"""
+    return (
+        texts.fillna("")
+        .astype(str)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.replace("/", " ", regex=False)
+        .str.replace("-", " ", regex=False)
+        .str.strip()
+    )
+
+
+def classify(row):
+    """Categorize a single row with `raw_text` and `txn_type`; use `classify_frame` for columns"""
+    text = str(row["raw_text"]).lower()
+    is_credit = row["txn_type"] == "credit"
+
+    for rule in CATEGORY_RULES:
+        if (rule.applies_to == "credit") != is_credit:
+            continue
+        if any(k in text for k in rule.keywords) and all(k in text for k in rule.all_of):
+            return rule.categories
+
+    return DEFAULT_CREDIT_CATEGORIES if is_credit else DEFAULT_DEBIT_CATEGORIES
+
+
+def classify_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply CATEGORY_RULES to every row at once, returning category_l1..l4"""
+    text = df["raw_text"].astype(str).str.lower()
+    is_credit = (df["txn_type"] == "credit").to_numpy()
+
+    keyword_hits = {}
+
+    def contains(keyword):
+        if keyword not in keyword_hits:
+            keyword_hits[keyword] = text.str.contains(keyword, regex=False).to_numpy()
+        return keyword_hits[keyword]
+
+    conditions = []
+    for rule in CATEGORY_RULES:
+        matched = np.logical_or.reduce([contains(k) for k in rule.keywords])
+        for keyword in rule.all_of:
+            matched = matched & contains(keyword)
+        direction = is_credit if rule.applies_to == "credit" else ~is_credit
+        conditions.append(matched & direction)
+
+    fallback = len(CATEGORY_RULES)
+    rule_index = np.select(conditions, np.arange(fallback), default=fallback)
+    rule_index = np.where(
+        (rule_index == fallback) & is_credit, fallback + 1, rule_index
+    )
+
+    lookup = np.array(
+        [rule.categories for rule in CATEGORY_RULES]
+        + [DEFAULT_DEBIT_CATEGORIES, DEFAULT_CREDIT_CATEGORIES],
+        dtype=object,
+    )
+    return pd.DataFrame(
+        lookup[rule_index],
+        columns=["category_l1", "category_l2", "category_l3", "category_l4"],
+        index=df.index,
+    )
+
+
+def _find_column(columns, keywords):
+    for keyword in keywords:
+        match = next((c for c in columns if keyword in c), None)
+        if match is not None:
+            return match
+    return None
+
+
+def _is_header(cells, spec: BankFormat) -> bool:
+    return all(
+        _find_column(cells, spec.columns.get(name, ())) is not None
+        for name in spec.header_fields
+    )
+
+
+def _detect_header(rows, spec: BankFormat) -> int:
+    if spec.header_row is not None:
+        return spec.header_row
+
+    for idx, cells in enumerate(rows):
+        if idx >= HEADER_SCAN_ROWS:
+            break
+        if _is_header(cells, spec):
+            return idx
+
+    raise ValueError(f"{spec.name} statement header not found")
+
+
+def _file_type(file_path: str, spec: BankFormat) -> str:
+    suffix = Path(file_path).suffix.lower().lstrip(".")
+    if suffix not in spec.file_types:
+        raise ValueError(
+            f"Unsupported {spec.name} statement type '.{suffix}', expected one of {spec.file_types}"
+        )
+    return suffix
+
+
+def _is_excel(file_path: str) -> bool:
+    with open(file_path, "rb") as fh:
+        return fh.read(4).startswith(EXCEL_SIGNATURES)
+
+
+def _header_name(cell) -> str:
+    return "" if pd.isna(cell) else str(cell).strip().lower()
+
+
+def _read_excel(file_path: str, file_type: str, spec: BankFormat) -> pd.DataFrame:
+    raw = pd.read_excel(file_path, engine=EXCEL_ENGINES[file_type], header=None)
+    raw = raw.dropna(how="all", axis=1)
+
+    rows = (
+        [str(c).strip().lower() for c in row if not pd.isna(c)]
+        for row in raw.itertuples(index=False)
+    )
+    header_idx = _detect_header(rows, spec)
+
+    df = raw.iloc[header_idx + 1 :].reset_index(drop=True)
+    df.columns = [_header_name(c) for c in raw.iloc[header_idx]]
+    return df
+
+
+def _read_text(file_path: str, spec: BankFormat) -> pd.DataFrame:
+    with open(file_path, encoding=spec.encoding, errors="replace", newline="") as fh:
+        lines = fh.readlines()
+
+    def delimiter_of(line):
+        return "\t" if "\t" in line else ","
+
+    def split(line):
+        return [c.strip().lower() for c in next(csv.reader([line], delimiter=delimiter_of(line)), [])]
+
+    header_idx = _detect_header((split(line) for line in lines), spec)
+    delimiter = delimiter_of(lines[header_idx])
+    columns = [_header_name(c) for c in next(csv.reader([lines[header_idx]], delimiter=delimiter))]
+    width = len(columns)
+
+    rows = []
+    reader = csv.reader(lines[header_idx + 1 :], delimiter=delimiter)
+    for cells in reader:
+        cells = [c.strip() or None for c in cells]
+        # Trailing delimiters are common; any other extra field would shift columns.
+        while len(cells) > width and cells[-1] is None:
+            cells.pop()
+        if len(cells) > width:
+            line_no = header_idx + 1 + reader.line_num
+            raise ValueError(
+                f"{spec.name} statement line {line_no} has {len(cells)} fields, header has {width}"
+            )
+        rows.append(cells + [None] * (width - len(cells)))
+
+    return pd.DataFrame(rows, columns=columns, dtype=object)
+
+
+def read_statement(file_path: str, spec: BankFormat) -> pd.DataFrame:
+    """Load the transaction table below the detected header row"""
+    file_type = _file_type(file_path, spec)
+
+    if file_type != "csv" and _is_excel(file_path):
+        df = _read_excel(file_path, file_type, spec)
+    else:
+        # Some banks export delimited text with an .xls extension.
+        df = _read_text(file_path, spec)
+
+    df = df.dropna(how="all")
+    df = df.loc[:, [c != "" for c in df.columns]]
+    return df
+
+
+def _to_number(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+    cleaned = series.astype(str).str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+def _zeros(df: pd.DataFrame) -> pd.Series:
+    return pd.Series(0.0, index=df.index)
+
+
+def _to_datetime(dates: pd.Series, spec: BankFormat) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+
+    # Excel date cells arrive as datetime objects mixed in with text cells;
+    # only the text cells go through the statement's date format.
+    kinds = dates.map(type)
+    is_text = kinds.eq(str)
+    is_native = kinds.isin(NATIVE_DATE_TYPES)
+
+    parsed = pd.to_datetime(
+        dates.where(is_text).str.strip(), format=spec.date_format, errors="coerce"
+    )
+    if is_native.any():
+        parsed = parsed.where(~is_native, pd.to_datetime(dates[is_native], errors="coerce"))
+    return parsed
+
+
+def _signed_amount(df: pd.DataFrame, cols: dict, spec: BankFormat) -> pd.Series:
+    if spec.sign_convention == "split":
+        if not cols["debit"] and not cols["credit"]:
+            raise ValueError(f"{spec.name} debit/credit columns not found")
+        debit = _to_number(df[cols["debit"]]).fillna(0) if cols["debit"] else _zeros(df)
+        credit = _to_number(df[cols["credit"]]).fillna(0) if cols["credit"] else _zeros(df)
+        return credit - debit
+
+    if not cols["amount"]:
+        raise ValueError(f"{spec.name} amount column not found")
+    amount = _to_number(df[cols["amount"]]).fillna(0)
+
+    if spec.sign_convention == "signed":
+        return amount
+
+    if not cols["indicator"]:
+        raise ValueError(f"{spec.name} debit/credit indicator column not found")
+    indicator = df[cols["indicator"]].fillna("").astype(str).str.strip().str.lower()
+    is_credit = indicator.str.startswith("cr")
+    is_debit = indicator.str.startswith("dr")
+
+    unsigned = ~(is_credit | is_debit) & (amount != 0)
+    if unsigned.any():
+        bad = df.loc[unsigned, cols["indicator"]].iloc[0]
+        raise ValueError(
+            f"{spec.name} has {int(unsigned.sum())} rows with unknown debit/credit indicator {bad!r}"
+        )
+    return amount.abs().where(is_credit, -amount.abs())
+
+
+def normalize_statement(df: pd.DataFrame, spec: BankFormat) -> pd.DataFrame:
+    """Map a raw statement table onto STANDARD_COLUMNS"""
+    cols = {
+        name: _find_column(df.columns, spec.columns.get(name, ()))
+        for name in ("date", "narration", "debit", "credit", "amount", "indicator", "balance")
+    }
+
+    if not cols["date"]:
+        raise ValueError("Date column not found")
+
+    out = pd.DataFrame(index=df.index)
+
+    out["date"] = _to_datetime(df[cols["date"]], spec)
+
+    out["year"] = out["date"].dt.year
+    out["month"] = out["date"].dt.month
+    out["day"] = out["date"].dt.day
+    out["month_name"] = out["date"].dt.month_name()
+    out["weekday"] = out["date"].dt.day_name()
+
+    if cols["narration"]:
+        out["raw_text"] = df[cols["narration"]].astype(str)
+    else:
+        out["raw_text"] = ""
+
+    out["description"] = clean_text_series(out["raw_text"])
+
+    out["amount"] = _signed_amount(df, cols, spec)
+
+    has_amount = pd.Series(False, index=df.index)
+    for name in ("debit", "credit", "amount"):
+        if cols[name]:
+            has_amount |= _to_number(df[cols[name]]).notna()
+    if has_amount.any() and out["date"][has_amount].isna().all():
+        raise ValueError(f"{spec.name} dates do not match format '{spec.date_format}'")
+
+    out["txn_type"] = np.select(
+        [out["amount"] > 0, out["amount"] < 0], ["credit", "debit"], default="neutral"
+    )
+
+    out[["category_l1", "category_l2", "category_l3", "category_l4"]] = classify_frame(out)
+
+    if cols["balance"]:
+        out["balance"] = _to_number(df[cols["balance"]])
+    else:
+        out["balance"] = None
+
+    out["source_bank"] = spec.name
+    out = out.dropna(subset=["date"])
+    out = out[STANDARD_COLUMNS]
+
+    return out
+
+
+def parse_statement(file_path: str, spec: BankFormat) -> pd.DataFrame:
+    """Parse any statement described by `spec` into the standard format"""
+    return normalize_statement(read_statement(file_path, spec), spec)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from data_pipeline.parsers.base import BankFormat, parse_statement
+
+
+HDFC_FORMAT = BankFormat(
+    name="HDFC",
+    date_format="%d/%m/%y",
+    columns={
+        "date": ("date",),
+        "narration": ("narration",),
+        "debit": ("withdrawal", "debit"),
+        "credit": ("deposit", "credit"),
+        "balance": ("closing balance", "balance"),
+    },
+    file_types=("xls", "xlsx", "csv"),
+)
+
+
+def parse_hdfc_file(file_path: str) -> pd.DataFrame:
+    """Clean HDFC statement into standard format"""
+    return parse_statement(file_path, HDFC_FORMAT)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from data_pipeline.parsers.base import BankFormat, parse_statement
+
+
+SBI_FORMAT = BankFormat(
+    name="SBI",
+    date_format="%d %b %Y",
+    columns={
+        "date": ("txn date", "date"),
+        "narration": ("description", "narration"),
+        "debit": ("debit", "withdraw"),
+        "credit": ("credit", "deposit"),
+        "balance": ("balance",),
+    },
+    file_types=("xls", "xlsx", "csv"),
+)
+
+
+def parse_sbi_file(file_path: str) -> pd.DataFrame:
+    """Clean SBI statement into standard format"""
+    return parse_statement(file_path, SBI_FORMAT)
@@ -0,0 +1,256 @@
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data_pipeline.parsers.base import (
+    STANDARD_COLUMNS,
+    BankFormat,
+    classify,
+    classify_frame,
+    parse_statement,
+)
+from data_pipeline.parsers.hdfc_parser import HDFC_FORMAT, parse_hdfc_file
+from data_pipeline.parsers.icici_parser import parse_icici_file
+from data_pipeline.parsers.sbi_parser import parse_sbi_file
+
+
+ICICI_STATEMENT = (
+    Path(__file__).resolve().parents[1] / "data" / "raw" / "icici" / "OpTransactionHistory26-02-2026.xls"
+)
+
+HDFC_CSV_HEADER = "Date,Narration,Chq./Ref.No.,Value Dt,Debit Amount,Credit Amount,Closing Balance\n"
+
+
+HDFC_CSV = """HDFC BANK Ltd.
+Statement of account
+Date,Narration,Chq./Ref.No.,Value Dt,Debit Amount,Credit Amount,Closing Balance
+01/04/25,UPI-ZOMATO-zomato@hdfc,0000,01/04/25,350.00,,"10,000.00"
+02/04/25,INTEREST PAID TILL 31-MAR-2025,0000,02/04/25,,120.00,"10,120.00"
+"""
+
+SBI_TAB_XLS = (
+    "Account Name       :\tMr. AVINDER\n"
+    "Address  :\tX, Y\n"
+    "\n"
+    "Txn Date\tValue Date\tDescription\tRef No./Cheque No.\tDebit\tCredit\tBalance\n"
+    "1 Apr 2025\t1 Apr 2025\tBY TRANSFER-NEFT-SALARY\t\t\t1,00,000.00\t1,20,000.00\n"
+    "2 Apr 2025\t2 Apr 2025\tTO TRANSFER-UPI/DR/swiggy\tx\t450.00\t\t1,19,550.00\n"
+    "**Computer generated statement\n"
+)
+
+SIGNED_FORMAT = BankFormat(
+    name="SIGNED",
+    date_format="%Y-%m-%d",
+    columns={"date": ("date",), "narration": ("details",), "amount": ("amount",)},
+    sign_convention="signed",
+    file_types=("csv",),
+)
+
+DR_CR_FORMAT = BankFormat(
+    name="DRCR",
+    date_format="%d-%m-%Y",
+    columns={
+        "date": ("date",),
+        "narration": ("particulars",),
+        "amount": ("amount",),
+        "indicator": ("dr/cr",),
+        "balance": ("balance",),
+    },
+    sign_convention="dr_cr",
+    file_types=("csv",),
+)
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    return str(path)
+
+
+def test_hdfc_csv_uses_debit_credit_amount_columns(tmp_path):
+    df = parse_hdfc_file(_write(tmp_path, "hdfc.csv", HDFC_CSV))
+
+    assert len(df) == 2
+    assert df["amount"].tolist() == [-350.0, 120.0]
+    assert df["txn_type"].tolist() == ["debit", "credit"]
+    assert df["date"].tolist() == [pd.Timestamp("2025-04-01"), pd.Timestamp("2025-04-02")]
+    assert df["balance"].tolist() == [10000.0, 10120.0]
+    assert set(df["source_bank"]) == {"HDFC"}
+
+
+def test_hdfc_xlsx_keeps_native_excel_dates(tmp_path):
+    path = tmp_path / "hdfc.xlsx"
+    rows = [
+        ["HDFC BANK Ltd.", None, None, None, None, None, None],
+        ["Date", "Narration", "Chq./Ref.No.", "Value Dt", "Withdrawal Amt.", "Deposit Amt.", "Closing Balance"],
+        [datetime(2024, 4, 1), "ATM WDL", "0", datetime(2024, 4, 1), 2000.0, None, 8000.0],
+        ["02/04/24", "SALARY APR", "0", "02/04/24", None, 50000.0, 58000.0],
+    ]
+    pd.DataFrame(rows).to_excel(path, header=False, index=False)
+
+    df = parse_hdfc_file(str(path))
+
+    assert len(df) == 2
+    assert df["date"].tolist() == [pd.Timestamp("2024-04-01"), pd.Timestamp("2024-04-02")]
+    assert df["amount"].tolist() == [-2000.0, 50000.0]
+    assert df["txn_type"].tolist() == ["debit", "credit"]
+    assert df["category_l4"].tolist() == ["ATM", "Employer"]
+
+
+def test_sbi_tab_delimited_xls(tmp_path):
+    df = parse_sbi_file(_write(tmp_path, "sbi.xls", SBI_TAB_XLS))
+
+    assert len(df) == 2
+    assert df["date"].tolist() == [pd.Timestamp("2025-04-01"), pd.Timestamp("2025-04-02")]
+    assert df["amount"].tolist() == [100000.0, -450.0]
+    assert df["txn_type"].tolist() == ["credit", "debit"]
+    assert df["balance"].tolist() == [120000.0, 119550.0]
+    assert df["description"].tolist() == ["BY TRANSFER NEFT SALARY", "TO TRANSFER UPI DR swiggy"]
+
+
+def test_signed_amount_convention(tmp_path):
+    content = "Date,Details,Amount\n2025-01-01,refund,\"1,250.50\"\n2025-01-02,atm,-500\n2025-01-03,fee reversal,0\n"
+    df = parse_statement(_write(tmp_path, "signed.csv", content), SIGNED_FORMAT)
+
+    assert len(df) == 3
+    assert df["amount"].tolist() == [1250.5, -500.0, 0.0]
+    assert df["txn_type"].tolist() == ["credit", "debit", "neutral"]
+    assert df["date"].tolist() == [
+        pd.Timestamp("2025-01-01"),
+        pd.Timestamp("2025-01-02"),
+        pd.Timestamp("2025-01-03"),
+    ]
+
+
+def test_dr_cr_indicator_convention(tmp_path):
+    content = (
+        "Statement for account 1234\n"
+        "Date,Particulars,Amount,Dr/Cr,Balance\n"
+        "05-03-2025,salary,\"75,000.00\",CR,\"75,000.00\"\n"
+        "06-03-2025,swiggy,350.00,DR,\"74,650.00\"\n"
+    )
+    df = parse_statement(_write(tmp_path, "drcr.csv", content), DR_CR_FORMAT)
+
+    assert len(df) == 2
+    assert df["amount"].tolist() == [75000.0, -350.0]
+    assert df["txn_type"].tolist() == ["credit", "debit"]
+    assert df["date"].tolist() == [pd.Timestamp("2025-03-05"), pd.Timestamp("2025-03-06")]
+    assert df["balance"].tolist() == [75000.0, 74650.0]
+
+
+def test_missing_debit_and_credit_columns_raise(tmp_path):
+    content = "Date,Narration,Amount\n01/04/25,salary,100\n"
+
+    with pytest.raises(ValueError, match="debit/credit columns not found"):
+        parse_statement(_write(tmp_path, "hdfc.csv", content), HDFC_FORMAT)
+
+
+def test_unparseable_dates_raise(tmp_path):
+    content = "Date,Narration,Debit Amount,Credit Amount\n2025-04-01,salary,,100\n"
+
+    with pytest.raises(ValueError, match="dates do not match format"):
+        parse_statement(_write(tmp_path, "hdfc.csv", content), HDFC_FORMAT)
+
+
+def test_classify_matches_classify_frame():
+    frame = pd.DataFrame(
+        {
+            "raw_text": ["NEFT from AVINDER state bank", "avinder", "UPI swiggy", "misc", "misc"],
+            "txn_type": ["credit", "credit", "debit", "credit", "neutral"],
+        }
+    )
+
+    expected = [tuple(row) for row in classify_frame(frame).itertuples(index=False)]
+
+    assert [classify(row) for _, row in frame.iterrows()] == expected
+    assert expected[0] == ("Transfer", "Self", "SBI", "SBI")
+
+
+def test_icici_bundled_statement_regression():
+    df = parse_icici_file(str(ICICI_STATEMENT))
+
+    assert list(df.columns) == STANDARD_COLUMNS
+    assert len(df) == 985
+    assert df["txn_type"].value_counts().to_dict() == {"debit": 865, "credit": 120}
+    assert df["category_l1"].value_counts().to_dict() == {
+        "Expense": 818,
+        "Income": 99,
+        "Transfer": 55,
+        "Investment": 13,
+    }
+    assert round(df["amount"].sum(), 2) == -477765.87
+
+    first, ppf, last = (df.iloc[i] for i in (0, 2, -1))
+    assert (first["date"], first["amount"], first["balance"]) == (pd.Timestamp("2025-04-01"), -42.0, 608092.06)
+    assert tuple(ppf[["category_l1", "category_l2", "category_l3", "category_l4"]]) == (
+        "Investment",
+        "Debt",
+        "PPF",
+        "PPF Contribution",
+    )
+    assert (last["date"], last["amount"], last["category_l4"]) == (pd.Timestamp("2026-02-25"), -577.19, "Cloudnine")
+
+
+def test_extra_unquoted_comma_raises_with_line_number(tmp_path):
+    content = "HDFC BANK Ltd.\n" + HDFC_CSV_HEADER + "01/04/25,UPI-ZOMATO,LTD,0000,01/04/25,350.00,,10000.00\n"
+
+    with pytest.raises(ValueError, match="line 3 has 8 fields, header has 7"):
+        parse_hdfc_file(_write(tmp_path, "hdfc.csv", content))
+
+
+def test_trailing_empty_field_is_allowed(tmp_path):
+    content = HDFC_CSV_HEADER + "01/04/25,UPI-ZOMATO,0000,01/04/25,350.00,,10000.00,\n"
+    df = parse_hdfc_file(_write(tmp_path, "hdfc.csv", content))
+
+    assert df["amount"].tolist() == [-350.0]
+    assert df["balance"].tolist() == [10000.0]
+
+
+def test_header_only_statements_return_empty_frame(tmp_path):
+    csv_df = parse_hdfc_file(_write(tmp_path, "hdfc.csv", "HDFC BANK Ltd.\n" + HDFC_CSV_HEADER))
+
+    xlsx_path = tmp_path / "hdfc.xlsx"
+    pd.DataFrame([HDFC_CSV_HEADER.strip().split(",")]).to_excel(xlsx_path, header=False, index=False)
+    xlsx_df = parse_hdfc_file(str(xlsx_path))
+
+    for df in (csv_df, xlsx_df):
+        assert df.empty
+        assert list(df.columns) == STANDARD_COLUMNS
+
+
+def test_sbi_footer_only_statement_returns_empty_frame(tmp_path):
+    content = (
+        "Account Name       :\tMr. AVINDER\n"
+        "Txn Date\tValue Date\tDescription\tRef No./Cheque No.\tDebit\tCredit\tBalance\n"
+        "**Computer generated statement\n"
+    )
+    df = parse_sbi_file(_write(tmp_path, "sbi.xls", content))
+
+    assert df.empty
+    assert list(df.columns) == STANDARD_COLUMNS
+
+
+@pytest.mark.parametrize("indicator", ["", "XX"])
+def test_dr_cr_unknown_indicator_raises(tmp_path, indicator):
+    content = "Date,Particulars,Amount,Dr/Cr,Balance\n06-03-2025,swiggy,350.00," + indicator + ",100\n"
+
+    with pytest.raises(ValueError, match="unknown debit/credit indicator"):
+        parse_statement(_write(tmp_path, "drcr.csv", content), DR_CR_FORMAT)
+
+
+def test_column_keywords_are_tried_in_priority_order(tmp_path):
+    content = (
+        "Date,Narration,Opening Balance,Withdrawal Amt.,Deposit Amt.,Closing Balance\n"
+        "01/04/25,ATM,500.00,100.00,,400.00\n"
+    )
+    df = parse_hdfc_file(_write(tmp_path, "hdfc.csv", content))
+
+    assert df["balance"].tolist() == [400.0]
+
+
+def test_bank_format_is_hashable_and_immutable():
+    assert hash(HDFC_FORMAT) == hash(HDFC_FORMAT)
+    with pytest.raises(TypeError):
+        HDFC_FORMAT.columns["date"] = ("when",)